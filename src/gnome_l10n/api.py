@@ -1,23 +1,52 @@
 """GNOME l10n.gnome.org API client with caching."""
 
+import base64
+import functools
+import gzip
+import http.client
 import json
+import mmap
+import operator
 import os
+import tempfile
 import threading
 import time
+import urllib.error
 import urllib.request
-from dataclasses import dataclass, asdict, field
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import List, Optional, Callable
+from urllib.parse import unquote, urljoin, urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fallback decoder when orjson is missing, built once rather than per call
+_json_decode = json.JSONDecoder().decode
 
 API_BASE = "https://l10n.gnome.org/api/v1"
+USER_AGENT = "gnome-l10n/0.2.0"
+
+# Concurrent module fetches and the request rate they share
+MAX_WORKERS = 8
+REQUESTS_PER_SECOND = 10
+
+# Release/language selections whose ETag/Last-Modified validators are kept
+VALIDATOR_SELECTIONS = 4
 
 
+@functools.lru_cache(maxsize=1)
 def get_cache_dir():
     p = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "gnome-l10n"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir():
     p = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "gnome-l10n"
     p.mkdir(parents=True, exist_ok=True)
@@ -25,8 +54,49 @@ def get_config_dir():
 
 
 CACHE_FILE = get_cache_dir() / "stats_cache.json"
+CACHE_META_FILE = get_cache_dir() / "stats_cache.meta.json"
+VALIDATORS_FILE = get_cache_dir() / "validators.json"
 CONFIG_FILE = get_config_dir() / "settings.json"
 
+
+def _loads(data):
+    """Parse JSON from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json_decode(str(data, "utf-8"))
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _read_json(path):
+    """Parse a JSON file straight from a read-only memory map of it."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return _loads(view)
+
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temporary file so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# Version of the stats cache file; 2 stores stats as positional rows
+CACHE_SCHEMA_VERSION = 2
+
 # Default settings
 DEFAULT_SETTINGS = {
     "cache_ttl": 3600,
@@ -35,26 +105,40 @@ DEFAULT_SETTINGS = {
 }
 
 
+_settings_cache = None
+
+
 def load_settings():
-    """Load user settings from config file."""
-    settings = dict(DEFAULT_SETTINGS)
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                stored = json.load(f)
-            settings.update(stored)
-        except Exception:
-            pass
-    return settings
+    """Load user settings from config file.
+
+    The parsed file is kept in memory and only re-read when its mtime changes.
+    """
+    global _settings_cache
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if _settings_cache is None or _settings_cache[0] != mtime:
+        settings = dict(DEFAULT_SETTINGS)
+        if mtime is not None:
+            try:
+                with open(CONFIG_FILE, "rb") as f:
+                    stored = _loads(f.read())
+                settings.update(stored)
+            except Exception:
+                pass
+        _settings_cache = (mtime, settings)
+    return dict(_settings_cache[1])
 
 
 def save_settings(settings):
     """Save user settings to config file."""
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(settings, f, indent=2)
+    global _settings_cache
+    _write_atomic(CONFIG_FILE, _dumps(settings, indent=True))
+    _settings_cache = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModuleStats:
     """Translation stats for one GNOME module/domain."""
     module: str
@@ -68,40 +152,204 @@ class ModuleStats:
     po_file: str = ""
     pot_file: str = ""
 
-    @property
-    def total(self):
-        return self.translated + self.fuzzy + self.untranslated
-
-    @property
-    def pct(self):
-        return (self.translated / self.total * 100) if self.total > 0 else 0.0
-
-    @property
-    def complete(self):
-        return self.fuzzy == 0 and self.untranslated == 0 and self.total > 0
+    # Derived values, computed once in __post_init__ and not persisted
+    total: int = field(init=False, repr=False, compare=False)
+    pct: float = field(init=False, repr=False, compare=False)
+    complete: bool = field(init=False, repr=False, compare=False)
+    vertimus_url: str = field(init=False, repr=False, compare=False)
+    po_url: str = field(init=False, repr=False, compare=False)
+    pot_url: str = field(init=False, repr=False, compare=False)
+    module_lower: str = field(init=False, repr=False, compare=False)
+    state_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The dataclass is frozen, so derived fields are set via object.__setattr__
+        setattr_ = object.__setattr__
+        total = self.translated + self.fuzzy + self.untranslated
+        setattr_(self, "total", total)
+        setattr_(self, "pct", (self.translated / total * 100) if total > 0 else 0.0)
+        setattr_(self, "complete", self.fuzzy == 0 and self.untranslated == 0 and total > 0)
+        setattr_(self, "vertimus_url",
+                 f"https://l10n.gnome.org/vertimus/{self.module}/{self.branch}/{self.domain}/{self.language}/")
+        setattr_(self, "po_url", f"https://l10n.gnome.org{self.po_file}" if self.po_file else "")
+        setattr_(self, "pot_url", f"https://l10n.gnome.org{self.pot_file}" if self.pot_file else "")
+        # The API may send null for either; treat that as empty
+        setattr_(self, "module_lower", (self.module or "").lower())
+        setattr_(self, "state_lower", (self.state or "").lower())
+
+
+_PERSISTED_FIELDS = tuple(f.name for f in fields(ModuleStats) if f.init)
+
+
+# Cached stats are stored as positional rows in _PERSISTED_FIELDS order
+_stats_to_row = operator.attrgetter(*_PERSISTED_FIELDS)
+
+
+class _RateLimiter:
+    """Spaces out request starts evenly across worker threads."""
+
+    def __init__(self, rate):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        # Reserve the next slot under the lock but sleep outside it, so
+        # workers wait for their own slots concurrently
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_rate_limiter = _RateLimiter(REQUESTS_PER_SECOND)
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="gnome-l10n")
+NOT_MODIFIED = object()
+# Set by shutdown(); queued module fetches then finish at once without a request
+_stopping = threading.Event()
+
+# Idle keep-alive connections per (scheme, host), shared by all threads
+_idle_connections = {}
+_pool_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme, host):
+    """Return (host, port, headers) of the proxy for scheme://host, or None.
+
+    Proxies come from the environment (http_proxy, https_proxy, no_proxy),
+    as with urllib.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urlsplit(proxy)
+    headers = {}
+    if parts.username:
+        creds = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode("ascii")
+    return parts.hostname, parts.port or 80, headers
+
+
+def _new_connection(scheme, host):
+    """Open a connection to scheme://host, tunnelling HTTPS through a proxy if one applies."""
+    proxy = _proxy_for(scheme, host)
+    if scheme != "https":
+        if proxy is None:
+            return http.client.HTTPConnection(host, timeout=15)
+        return http.client.HTTPConnection(proxy[0], proxy[1], timeout=15)
+    if proxy is None:
+        return http.client.HTTPSConnection(host, timeout=15)
+    conn = http.client.HTTPSConnection(proxy[0], proxy[1], timeout=15)
+    conn.set_tunnel(host, headers=proxy[2])
+    return conn
+
+
+def _acquire_connection(scheme, host):
+    """Take an idle connection to scheme://host from the pool, or open a new one."""
+    with _pool_lock:
+        idle = _idle_connections.get((scheme, host))
+        if idle:
+            return idle.pop()
+    return _new_connection(scheme, host)
+
+
+def _release_connection(scheme, host, conn):
+    """Return a connection that is still usable to the pool."""
+    with _pool_lock:
+        _idle_connections.setdefault((scheme, host), []).append(conn)
+
+
+def _prewarm():
+    """Resolve and connect to the API host ahead of the first request."""
+    parts = urlsplit(API_BASE)
+    # Always a new connection: connect() on a pooled, open one would leak its socket
+    conn = _new_connection(parts.scheme, parts.netloc)
+    try:
+        conn.connect()
+    except OSError:
+        conn.close()
+    else:
+        _release_connection(parts.scheme, parts.netloc, conn)
+
+
+def prewarm():
+    """Start connecting to the API host in the background.
+
+    Runs on a daemon thread so a slow handshake never delays exit.
+    """
+    threading.Thread(target=_prewarm, daemon=True, name="gnome-l10n-prewarm").start()
+
+
+def _request(url, headers=None, redirects=5):
+    """GET url over a pooled keep-alive connection. Returns (response, body).
+
+    Responses other than 200 and 304 Not Modified raise HTTPError.
+    """
+    parts = urlsplit(url)
+    scheme, host = parts.scheme, parts.netloc
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip", **(headers or {})}
+    send_headers = headers
+    proxy = _proxy_for(scheme, host)
+    if proxy is not None and scheme != "https":
+        # Plain HTTP goes to the proxy itself, asking for the full URL
+        target = f"{scheme}://{host}{target}"
+        send_headers = {**headers, **proxy[2], "Host": host}
+    conn = _acquire_connection(scheme, host)
+    for attempt in range(2):
+        try:
+            conn.request("GET", target, headers=send_headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; retry once on a fresh one
+            conn.close()
+            if attempt:
+                raise
+            conn = _new_connection(scheme, host)
+        except Exception:
+            conn.close()
+            raise
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_connection(scheme, host, conn)
+    if resp.status in (301, 302, 303, 307, 308) and redirects:
+        return _request(urljoin(url, resp.getheader("Location")), headers, redirects - 1)
+    if resp.status not in (200, 304):
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    if body and resp.getheader("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return resp, body
 
-    @property
-    def vertimus_url(self):
-        return f"https://l10n.gnome.org/vertimus/{self.module}/{self.branch}/{self.domain}/{self.language}/"
 
-    @property
-    def po_url(self):
-        if self.po_file:
-            return f"https://l10n.gnome.org{self.po_file}"
-        return ""
+def _fetch_json(url):
+    """Fetch JSON from URL."""
+    return _loads(_request(url)[1])
 
-    @property
-    def pot_url(self):
-        if self.pot_file:
-            return f"https://l10n.gnome.org{self.pot_file}"
-        return ""
 
+def _fetch_json_conditional(url, etag="", last_modified=""):
+    """Fetch JSON from URL, revalidating a previous response.
 
-def _fetch_json(url):
-    """Fetch JSON from URL."""
-    req = urllib.request.Request(url, headers={"User-Agent": "gnome-l10n/0.2.0"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read())
+    Returns (data, etag, last_modified); data is NOT_MODIFIED when the
+    server answers 304.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp, body = _request(url, headers)
+    if resp.status == 304:
+        return NOT_MODIFIED, etag, last_modified
+    return _loads(body), resp.getheader("ETag", ""), resp.getheader("Last-Modified", "")
 
 
 def get_releases():
@@ -120,85 +368,195 @@ def get_module_stats(module, branch, domain, language="sv"):
     """Get detailed stats for one module."""
     url = f"{API_BASE}/modules/{module}/branches/{branch}/domains/{domain}/languages/{language}"
     data = _fetch_json(url)
-    stats = data.get("statistics", {})
+    return _stats_from_json(data, module, branch, domain, data.get("language", language))
+
+
+def _stats_from_json(d, module="", branch="", domain="po", language="sv"):
+    """Build ModuleStats from a module stats response; the arguments are fallbacks."""
+    get = d.get
+    s = get("statistics", {})
     return ModuleStats(
-        module=data.get("module", module),
-        branch=data.get("branch", branch),
-        domain=data.get("domain", domain),
-        language=data.get("language", language),
-        translated=stats.get("trans", 0),
-        fuzzy=stats.get("fuzzy", 0),
-        untranslated=stats.get("untrans", 0),
-        state=data.get("state", ""),
-        po_file=data.get("po_file", ""),
-        pot_file=data.get("pot_file", ""),
+        get("module", module), get("branch", branch), get("domain", domain), language,
+        s.get("trans", 0), s.get("fuzzy", 0), s.get("untrans", 0),
+        get("state", ""), get("po_file", ""), get("pot_file", ""),
     )
 
 
-def fetch_all_stats(release, language="sv", progress_cb=None):
-    """Fetch stats for all modules in a release. Returns list of ModuleStats."""
+def _fetch_module(url, m, language, cached=None):
+    """Fetch stats for one entry of a release's module list.
+
+    cached is the validator entry stored for url by a previous fetch; it is
+    used for a conditional request. Returns (ModuleStats, validator entry).
+    """
+    cached = cached or {}
+    if _stopping.is_set():
+        raise CancelledError()
+    _rate_limiter.wait()
+    if _stopping.is_set():
+        raise CancelledError()
+    d, etag, last_modified = _fetch_json_conditional(
+        url, cached.get("etag", ""), cached.get("last_modified", ""))
+    if d is NOT_MODIFIED:
+        return ModuleStats(*cached["stats"]), cached
+    ms = _stats_from_json(d, m.get("module", ""), m.get("branch", ""), "po", language)
+    entry = None
+    if etag or last_modified:
+        entry = {"etag": etag, "last_modified": last_modified, "stats": _stats_to_row(ms)}
+    return ms, entry
+
+
+def _iter_indexed_stats(release, language, progress_cb):
+    """Yield (index in the release's module list, ModuleStats) as fetches complete.
+
+    Modules fetched before are revalidated with ETag/Last-Modified, so
+    unchanged ones cost a 304 instead of a full download.
+    """
     data = get_release_stats(release, language)
-    modules = data.get("modules", [])
-    results = []
-
-    for i, m in enumerate(modules):
-        stats_path = m.get("stats", "")
-        if not stats_path:
-            continue
+    modules = [m for m in data.get("modules", []) if m.get("stats")]
+    urls = [f"https://l10n.gnome.org{m['stats']}" for m in modules]
+    selections = _load_validators()
+    selection = f"{release}/{language}"
+    validators = selections.pop(selection, {})
+
+    futures = {
+        _executor.submit(_fetch_module, url, m, language, validators.get(url)): i
+        for i, (url, m) in enumerate(zip(urls, modules))
+    }
+    try:
+        for done, fut in enumerate(as_completed(futures), 1):
+            try:
+                ms, entry = fut.result()
+            except CancelledError:
+                # Shutting down: the fetch is aborted, not a module short
+                raise
+            except Exception:
+                ms = None
+            else:
+                # A fresh response without validators leaves nothing to revalidate
+                if entry:
+                    validators[urls[futures[fut]]] = entry
+                else:
+                    validators.pop(urls[futures[fut]], None)
+
+            if progress_cb:
+                progress_cb(done, len(modules))
+            if ms is not None:
+                yield futures[fut], ms
+    finally:
+        # Stopped early: drop fetches that have not started yet
+        for fut in futures:
+            fut.cancel()
+        # This selection becomes the most recent; only the latest few are kept,
+        # each with just the modules the release still lists
+        selections[selection] = {url: validators[url] for url in urls if url in validators}
+        for old in list(selections)[:-VALIDATOR_SELECTIONS]:
+            del selections[old]
         try:
-            url = f"https://l10n.gnome.org{stats_path}"
-            d = _fetch_json(url)
-            s = d.get("statistics", {})
-            ms = ModuleStats(
-                module=d.get("module", m.get("module", "")),
-                branch=d.get("branch", m.get("branch", "")),
-                domain=d.get("domain", "po"),
-                language=language,
-                translated=s.get("trans", 0),
-                fuzzy=s.get("fuzzy", 0),
-                untranslated=s.get("untrans", 0),
-                state=d.get("state", ""),
-                po_file=d.get("po_file", ""),
-                pot_file=d.get("pot_file", ""),
-            )
-            results.append(ms)
-        except Exception:
+            _save_validators(selections)
+        except OSError:
             pass
 
-        if progress_cb:
-            progress_cb(i + 1, len(modules))
 
-        # Rate limit
-        time.sleep(0.1)
+def iter_all_stats(release, language="sv", progress_cb=None):
+    """Yield ModuleStats for all modules in a release as their fetches complete.
+
+    Raises CancelledError if fetching is stopped by shutdown().
+    """
+    with closing(_iter_indexed_stats(release, language, progress_cb)) as results:
+        for _index, ms in results:
+            yield ms
+
+
+def fetch_all_stats(release, language="sv", progress_cb=None, cancelled=None):
+    """Fetch stats for all modules in a release. Returns list of ModuleStats.
+
+    The list keeps the release's module order, so sorting it is stable
+    across refreshes. cancelled is polled as fetches complete; once it
+    returns true the fetches not yet started are dropped and None is
+    returned. None is also returned if fetching is stopped by shutdown(),
+    so a partial list is never mistaken for a complete one.
+    """
+    results = []
+    try:
+        with closing(_iter_indexed_stats(release, language, progress_cb)) as it:
+            for item in it:
+                if cancelled is not None and cancelled():
+                    return None
+                results.append(item)
+    except CancelledError:
+        return None
+    results.sort(key=operator.itemgetter(0))
+    return [ms for _index, ms in results]
+
+
+def shutdown():
+    """Stop the fetch workers so exit is not held up by queued requests.
 
-    return results
+    Queued fetches are not cancelled, since a cancelled future never
+    reaches as_completed() and would leave a running fetch waiting on it
+    forever. They complete at once with CancelledError instead.
+    """
+    _stopping.set()
+    _executor.shutdown(wait=False)
+
+
+def _load_validators():
+    """Load the ETag/Last-Modified store.
+
+    Returns {"release/language": {module stats URL: entry}}, oldest
+    selection first.
+    """
+    try:
+        return _read_json(VALIDATORS_FILE).get("selections", {})
+    except Exception:
+        return {}
+
+
+def _save_validators(selections):
+    """Save the ETag/Last-Modified store."""
+    _write_atomic(VALIDATORS_FILE, _dumps({"selections": selections}))
 
 
 def save_cache(release, language, stats):
     """Save stats to cache."""
-    data = {
+    meta = {
         "release": release,
         "language": language,
         "timestamp": time.time(),
-        "stats": [asdict(s) for s in stats],
     }
-    with open(CACHE_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    data = {
+        "schema_version": CACHE_SCHEMA_VERSION,
+        "stats": [_stats_to_row(s) for s in stats],
+    }
+    # Drop the old metadata first so it never describes a different stats file
+    CACHE_META_FILE.unlink(missing_ok=True)
+    _write_atomic(CACHE_FILE, _dumps(data))
+    _write_atomic(CACHE_META_FILE, _dumps(meta))
 
 
 def load_cache(release, language, max_age=None):
-    """Load stats from cache if fresh enough."""
+    """Load stats from cache if fresh enough.
+
+    Freshness is judged from the small metadata file, so a stale or
+    mismatching cache is rejected without parsing the stats.
+    """
     if max_age is None:
         max_age = load_settings().get("cache_ttl", 3600)
-    if not CACHE_FILE.exists():
-        return None
     try:
-        with open(CACHE_FILE) as f:
-            data = json.load(f)
-        if data.get("release") != release or data.get("language") != language:
+        meta = _read_json(CACHE_META_FILE)
+        if meta.get("release") != release or meta.get("language") != language:
             return None
-        if time.time() - data.get("timestamp", 0) > max_age:
+        if time.time() - meta.get("timestamp", 0) > max_age:
             return None
-        return [ModuleStats(**s) for s in data.get("stats", [])]
+        data = _read_json(CACHE_FILE)
+        if data.get("schema_version") != CACHE_SCHEMA_VERSION:
+            return None
+        return [ModuleStats(*row) for row in data.get("stats", [])]
     except Exception:
         return None
+
+
+def clear_cache():
+    """Remove cached stats. Validators are kept so refetching can revalidate."""
+    CACHE_META_FILE.unlink(missing_ok=True)
+    CACHE_FILE.unlink(missing_ok=True)
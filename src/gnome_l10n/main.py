@@ -3,22 +3,23 @@
 
 import gettext
 import locale
+import operator
 import os
-import subprocess
+import re
 import sys
-import threading
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Gtk, Adw, Gio, GLib
+from gi.repository import Gtk, Adw, Gio, GLib, GObject
 
 from gnome_l10n import __version__
 from gnome_l10n.api import (
     get_releases, fetch_all_stats, save_cache, load_cache, ModuleStats,
-    load_settings, save_settings, DEFAULT_SETTINGS, get_cache_dir,
+    load_settings, save_settings, DEFAULT_SETTINGS, clear_cache, prewarm, shutdown,
 )
 
 # i18n setup
@@ -44,6 +45,12 @@ if LOCALE_DIR:
 gettext.textdomain(TEXTDOMAIN)
 _ = gettext.gettext
 
+
+def N_(message):
+    """Mark a string for translation; it is translated where it is shown."""
+    return message
+
+
 APP_ID = "se.danielnylander.GnomeL10n"
 
 # Common GNOME languages
@@ -59,55 +66,177 @@ LANGUAGES = [
     ("ro", "Romanian"), ("gl", "Galician"), ("eu", "Basque"),
     ("sl", "Slovenian"), ("hr", "Croatian"), ("sr", "Serbian"),
 ]
+LANG_INDEX = {code: i for i, (code, _name) in enumerate(LANGUAGES)}
 
 SORT_OPTIONS = [
-    ("pct_asc", _("Completion % (low → high)")),
-    ("pct_desc", _("Completion % (high → low)")),
-    ("name_asc", _("Module name (A → Z)")),
-    ("name_desc", _("Module name (Z → A)")),
-    ("untrans_desc", _("Untranslated (most first)")),
-    ("fuzzy_desc", _("Fuzzy (most first)")),
-    ("total_desc", _("Total strings (most first)")),
-    ("state", _("State")),
+    ("pct_asc", N_("Completion % (low → high)")),
+    ("pct_desc", N_("Completion % (high → low)")),
+    ("name_asc", N_("Module name (A → Z)")),
+    ("name_desc", N_("Module name (Z → A)")),
+    ("untrans_desc", N_("Untranslated (most first)")),
+    ("fuzzy_desc", N_("Fuzzy (most first)")),
+    ("total_desc", N_("Total strings (most first)")),
+    ("state", N_("State")),
 ]
 
+
+def _state_sort_key(s):
+    # Modules without a state sort last
+    return s.state_lower or "zzz"
+
+
+# Sort key -> (key function, reverse)
+_SORT_KEYS = {
+    "pct_asc": (operator.attrgetter("pct"), False),
+    "pct_desc": (operator.attrgetter("pct"), True),
+    "name_asc": (operator.attrgetter("module_lower"), False),
+    "name_desc": (operator.attrgetter("module_lower"), True),
+    "untrans_desc": (operator.attrgetter("untranslated"), True),
+    "fuzzy_desc": (operator.attrgetter("fuzzy"), True),
+    "total_desc": (operator.attrgetter("total"), True),
+    "state": (_state_sort_key, False),
+}
+
+# Filter mode -> test a module must pass; "all" has none
+_FILTER_MODES = {
+    "incomplete": lambda s: not s.complete,
+    "complete": operator.attrgetter("complete"),
+    "fuzzy": lambda s: s.fuzzy > 0,
+    "state_translated": lambda s: s.state_lower == "translated",
+}
+
+SEARCH_DELAY_MS = 150
+
 CACHE_TTL_OPTIONS = [
-    (1800, _("30 minutes")),
-    (3600, _("1 hour")),
-    (7200, _("2 hours")),
-    (14400, _("4 hours")),
+    (1800, N_("30 minutes")),
+    (3600, N_("1 hour")),
+    (7200, N_("2 hours")),
+    (14400, N_("4 hours")),
 ]
+TTL_INDEX = {ttl: i for i, (ttl, _label) in enumerate(CACHE_TTL_OPTIONS)}
 
 
 def _open_url(url):
     """Open URL in default browser."""
+    import subprocess
     try:
         subprocess.Popen(["xdg-open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception:
         pass
 
 
-def _state_css_class(state):
-    """Return CSS class for a vertimus state."""
-    s = state.lower() if state else ""
-    if s == "translated":
-        return "success"
-    elif s in ("none", ""):
-        return "dim-label"
-    elif "commit" in s:
-        return "success"
-    elif "upload" in s:
-        return "accent"
-    else:
-        return "warning"
+# Vertimus state (lower case) -> CSS class; other states are added on first use
+_STATE_CSS = {
+    "": "dim-label",
+    "none": "dim-label",
+    "translated": "success",
+}
 
 
-class StatsRow(Gtk.Box):
-    """A row showing module translation stats with a progress bar."""
+def _state_css_class(state_lower):
+    """Return CSS class for a vertimus state, given in lower case (ModuleStats.state_lower)."""
+    css = _STATE_CSS.get(state_lower)
+    if css is None:
+        if "commit" in state_lower:
+            css = "success"
+        elif "upload" in state_lower:
+            css = "accent"
+        else:
+            css = "warning"
+        _STATE_CSS[state_lower] = css
+    return css
+
+
+class StatsItem(GObject.Object):
+    """List model item wrapping a ModuleStats."""
 
     def __init__(self, stats: ModuleStats):
-        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        super().__init__()
         self.stats = stats
+
+
+_CSV_HEADER = ["Module", "Branch", "Domain", "State", "Translated", "Fuzzy",
+               "Untranslated", "Total", "Percent", "Vertimus URL"]
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+
+def _stats_csv(stats):
+    """Return stats as CSV text, ending with the app credit line."""
+    credit = f"GNOME L10n v{__version__} — Daniel Nylander"
+    # Text fields may be None from the API; csv.writer writes those as empty
+    text_fields = "".join(f"{s.module or ''}{s.branch or ''}{s.domain or ''}{s.state or ''}"
+                          for s in stats)
+    if not _CSV_SPECIAL.search(text_fields):
+        # Nothing needs quoting: format rows directly, as csv.writer would
+        lines = [",".join(_CSV_HEADER)]
+        lines += [f"{s.module or ''},{s.branch or ''},{s.domain or ''},{s.state or ''},"
+                  f"{s.translated},{s.fuzzy},{s.untranslated},{s.total},{s.pct:.1f},{s.vertimus_url}"
+                  for s in stats]
+        lines += ["", credit, ""]
+        return "\r\n".join(lines)
+
+    import csv, io
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(_CSV_HEADER)
+    for s in stats:
+        writer.writerow([s.module, s.branch, s.domain, s.state, s.translated,
+                         s.fuzzy, s.untranslated, s.total, f"{s.pct:.1f}",
+                         s.vertimus_url])
+    writer.writerow([])
+    writer.writerow([credit])
+    return output.getvalue()
+
+
+class ProgressCell(Gtk.DrawingArea):
+    """A flat completion bar drawn with Cairo; much lighter than Gtk.ProgressBar.
+
+    The bar uses the widget's CSS color, so style classes such as
+    "success" or "warning" pick its color. It reports itself to assistive
+    technologies as a progress bar, as Gtk.ProgressBar does.
+    """
+
+    def __init__(self):
+        super().__init__(accessible_role=Gtk.AccessibleRole.PROGRESS_BAR)
+        self._fraction = 0.0
+        self.set_content_height(8)
+        self.set_draw_func(self._draw)
+        self.update_property(
+            [Gtk.AccessibleProperty.VALUE_MIN, Gtk.AccessibleProperty.VALUE_MAX,
+             Gtk.AccessibleProperty.VALUE_NOW],
+            [0.0, 1.0, 0.0])
+
+    def set_fraction(self, fraction):
+        self._fraction = fraction
+        self.update_property([Gtk.AccessibleProperty.VALUE_NOW], [fraction])
+        self.queue_draw()
+
+    def _draw(self, _area, cr, width, height, *_args):
+        color = self.get_color()
+        cr.set_source_rgba(color.red, color.green, color.blue, 0.15)
+        cr.rectangle(0, 0, width, height)
+        cr.fill()
+        cr.set_source_rgba(color.red, color.green, color.blue, color.alpha)
+        cr.rectangle(0, 0, width * self._fraction, height)
+        cr.fill()
+
+
+def _add_classes(widget, *names):
+    """Add several CSS classes to a widget."""
+    for name in names:
+        widget.add_css_class(name)
+
+
+class StatsRow(Gtk.Box):
+    """A row showing module translation stats with a progress bar.
+
+    Rows are recycled by the list view: the widgets are built once and
+    bind() fills them in for a module.
+    """
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.stats = None
         self.set_margin_top(6)
         self.set_margin_bottom(6)
         self.set_margin_start(12)
@@ -121,74 +250,62 @@ class StatsRow(Gtk.Box):
         name_btn = Gtk.Button()
         name_btn.add_css_class("flat")
         name_btn.set_halign(Gtk.Align.START)
-        name_label = Gtk.Label(label=stats.module)
-        name_label.add_css_class("heading")
-        name_label.set_ellipsize(3)
-        name_label.set_max_width_chars(28)
-        name_btn.set_child(name_label)
+        self.name_label = Gtk.Label()
+        self.name_label.add_css_class("heading")
+        self.name_label.set_ellipsize(3)
+        self.name_label.set_max_width_chars(28)
+        name_btn.set_child(self.name_label)
         name_btn.set_tooltip_text(_("Open on l10n.gnome.org"))
-        name_btn.connect("clicked", lambda *_: _open_url(stats.vertimus_url))
+        name_btn.connect("clicked", lambda *_: _open_url(self.stats.vertimus_url))
         name_box.append(name_btn)
 
         # Branch/domain + state
         detail_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        detail_label = Gtk.Label(label=f"{stats.branch} / {stats.domain}")
-        detail_label.set_halign(Gtk.Align.START)
-        detail_label.add_css_class("dim-label")
-        detail_label.add_css_class("caption")
-        detail_box.append(detail_label)
+        self.detail_label = Gtk.Label()
+        self.detail_label.set_halign(Gtk.Align.START)
+        _add_classes(self.detail_label, "dim-label", "caption")
+        detail_box.append(self.detail_label)
 
-        if stats.state:
-            state_label = Gtk.Label(label=stats.state)
-            state_label.add_css_class("caption")
-            state_label.add_css_class(_state_css_class(stats.state))
-            detail_box.append(state_label)
+        self.state_label = Gtk.Label()
+        self.state_label.add_css_class("caption")
+        self._state_class = None
+        detail_box.append(self.state_label)
 
         name_box.append(detail_box)
         self.append(name_box)
 
         # Progress bar
-        progress = Gtk.ProgressBar()
-        progress.set_fraction(stats.pct / 100.0)
-        progress.set_hexpand(True)
-        progress.set_valign(Gtk.Align.CENTER)
-        progress.set_show_text(True)
-        progress.set_text(f"{stats.pct:.0f}%")
-
-        if stats.complete:
-            progress.add_css_class("success")
-        elif stats.pct >= 80:
-            pass
-        elif stats.pct >= 50:
-            progress.add_css_class("warning")
-
-        self.append(progress)
+        self.progress = ProgressCell()
+        self._progress_class = None
+        self.progress.set_hexpand(True)
+        self.progress.set_valign(Gtk.Align.CENTER)
+        self.append(self.progress)
+
+        self.pct_label = Gtk.Label()
+        self.pct_label.add_css_class("caption")
+        self.pct_label.set_width_chars(4)
+        self.pct_label.set_xalign(1.0)
+        self.append(self.pct_label)
 
         # Stats numbers
         nums_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         nums_box.set_size_request(180, -1)
 
-        t_label = Gtk.Label(label=f"✓ {stats.translated}")
-        t_label.add_css_class("success")
-        t_label.add_css_class("caption")
-        nums_box.append(t_label)
+        self.t_label = Gtk.Label()
+        _add_classes(self.t_label, "success", "caption")
+        nums_box.append(self.t_label)
 
-        if stats.fuzzy > 0:
-            f_label = Gtk.Label(label=f"~ {stats.fuzzy}")
-            f_label.add_css_class("warning")
-            f_label.add_css_class("caption")
-            nums_box.append(f_label)
+        self.f_label = Gtk.Label()
+        _add_classes(self.f_label, "warning", "caption")
+        nums_box.append(self.f_label)
 
-        if stats.untranslated > 0:
-            u_label = Gtk.Label(label=f"✗ {stats.untranslated}")
-            u_label.add_css_class("error")
-            u_label.add_css_class("caption")
-            nums_box.append(u_label)
+        self.u_label = Gtk.Label()
+        _add_classes(self.u_label, "error", "caption")
+        nums_box.append(self.u_label)
 
-        total_label = Gtk.Label(label=f"({stats.total})")
-        total_label.add_css_class("dim-label")
-        total_label.add_css_class("caption")
-        nums_box.append(total_label)
+        self.total_label = Gtk.Label()
+        _add_classes(self.total_label, "dim-label", "caption")
+        nums_box.append(self.total_label)
 
         self.append(nums_box)
 
@@ -196,22 +313,59 @@ class StatsRow(Gtk.Box):
         btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
 
         # Download PO
-        if stats.po_url:
-            dl_btn = Gtk.Button(icon_name="document-save-symbolic")
-            dl_btn.add_css_class("flat")
-            dl_btn.set_tooltip_text(_("Download PO file"))
-            dl_btn.connect("clicked", lambda *_: _open_url(stats.po_url))
-            btn_box.append(dl_btn)
+        self.dl_btn = Gtk.Button(icon_name="document-save-symbolic")
+        self.dl_btn.add_css_class("flat")
+        self.dl_btn.set_tooltip_text(_("Download PO file"))
+        self.dl_btn.connect("clicked", lambda *_: _open_url(self.stats.po_url))
+        btn_box.append(self.dl_btn)
 
         # Open vertimus page
         web_btn = Gtk.Button(icon_name="web-browser-symbolic")
         web_btn.add_css_class("flat")
         web_btn.set_tooltip_text(_("Open vertimus page"))
-        web_btn.connect("clicked", lambda *_: _open_url(stats.vertimus_url))
+        web_btn.connect("clicked", lambda *_: _open_url(self.stats.vertimus_url))
         btn_box.append(web_btn)
 
         self.append(btn_box)
 
+    def bind(self, stats: ModuleStats):
+        """Show stats in this row."""
+        self.stats = stats
+        self.name_label.set_label(stats.module)
+        self.detail_label.set_label(f"{stats.branch} / {stats.domain}")
+
+        if self._state_class:
+            self.state_label.remove_css_class(self._state_class)
+            self._state_class = None
+        self.state_label.set_visible(bool(stats.state))
+        if stats.state:
+            self.state_label.set_label(stats.state)
+            self._state_class = _state_css_class(stats.state_lower)
+            self.state_label.add_css_class(self._state_class)
+
+        self.progress.set_fraction(stats.pct / 100.0)
+        self.pct_label.set_label(f"{stats.pct:.0f}%")
+        if stats.complete:
+            progress_class = "success"
+        elif 50 <= stats.pct < 80:
+            progress_class = "warning"
+        else:
+            progress_class = "accent"
+        if progress_class != self._progress_class:
+            if self._progress_class:
+                self.progress.remove_css_class(self._progress_class)
+            self.progress.add_css_class(progress_class)
+            self._progress_class = progress_class
+
+        self.t_label.set_label(f"✓ {stats.translated}")
+        self.f_label.set_visible(stats.fuzzy > 0)
+        self.f_label.set_label(f"~ {stats.fuzzy}")
+        self.u_label.set_visible(stats.untranslated > 0)
+        self.u_label.set_label(f"✗ {stats.untranslated}")
+        self.total_label.set_label(f"({stats.total})")
+
+        self.dl_btn.set_visible(bool(stats.po_url))
+
 
 class PreferencesWindow(Adw.PreferencesWindow):
     """Settings window."""
@@ -232,11 +386,9 @@ class PreferencesWindow(Adw.PreferencesWindow):
         lang_names = [f"{code} — {name}" for code, name in LANGUAGES]
         lang_model = Gtk.StringList.new(lang_names)
         lang_row.set_model(lang_model)
-        current_lang = settings.get("default_language", "sv")
-        for i, (code, _name) in enumerate(LANGUAGES):
-            if code == current_lang:
-                lang_row.set_selected(i)
-                break
+        idx = LANG_INDEX.get(settings.get("default_language", "sv"))
+        if idx is not None:
+            lang_row.set_selected(idx)
         lang_row.connect("notify::selected", self._on_lang_changed)
         general.add(lang_row)
 
@@ -252,14 +404,12 @@ class PreferencesWindow(Adw.PreferencesWindow):
         cache_grp = Adw.PreferencesGroup(title=_("Cache"))
 
         ttl_row = Adw.ComboRow(title=_("Cache Duration"))
-        ttl_names = [label for _, label in CACHE_TTL_OPTIONS]
+        ttl_names = [_(label) for _ttl, label in CACHE_TTL_OPTIONS]
         ttl_model = Gtk.StringList.new(ttl_names)
         ttl_row.set_model(ttl_model)
-        current_ttl = settings.get("cache_ttl", 3600)
-        for i, (val, _) in enumerate(CACHE_TTL_OPTIONS):
-            if val == current_ttl:
-                ttl_row.set_selected(i)
-                break
+        idx = TTL_INDEX.get(settings.get("cache_ttl", 3600))
+        if idx is not None:
+            ttl_row.set_selected(idx)
         ttl_row.connect("notify::selected", self._on_ttl_changed)
         cache_grp.add(ttl_row)
 
@@ -290,11 +440,20 @@ class MainWindow(Adw.ApplicationWindow):
         self.set_title(_("GNOME L10n"))
 
         self._stats = []
+        self._loaded_at = ""
         self._settings = load_settings()
         self._release = self._settings.get("default_release", "gnome-49")
         self._language = self._settings.get("default_language", "sv")
         self._dark = False
         self._sort_key = "pct_asc"
+        self._filter_mode = "all"
+        self._query = ""
+        self._applied_mode = "all"
+        self._predicate = None
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._stats_future = None
+        self._fetch_gen = 0
+        self._stats_key = None
 
         # Main layout
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -345,6 +504,8 @@ class MainWindow(Adw.ApplicationWindow):
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_hexpand(True)
         self.search_entry.set_placeholder_text(_("Filter modules..."))
+        # search-changed is already debounced by the entry itself
+        self.search_entry.set_search_delay(SEARCH_DELAY_MS)
         self.search_entry.connect("search-changed", self._on_search_changed)
         self.search_bar.set_child(self.search_entry)
         self.search_bar.connect_entry(self.search_entry)
@@ -370,16 +531,15 @@ class MainWindow(Adw.ApplicationWindow):
         self.language_dropdown = Gtk.DropDown.new_from_strings(lang_names)
         self.language_dropdown.set_size_request(220, -1)
         # Select default language
-        for i, (code, _name) in enumerate(LANGUAGES):
-            if code == self._language:
-                self.language_dropdown.set_selected(i)
-                break
+        idx = LANG_INDEX.get(self._language)
+        if idx is not None:
+            self.language_dropdown.set_selected(idx)
         self.language_dropdown.connect("notify::selected", self._on_language_changed)
         controls.append(self.language_dropdown)
 
         # Sort dropdown
         controls.append(Gtk.Label(label=_("Sort:")))
-        sort_names = [label for _, label in SORT_OPTIONS]
+        sort_names = [_(label) for _key, label in SORT_OPTIONS]
         self.sort_dropdown = Gtk.DropDown.new_from_strings(sort_names)
         self.sort_dropdown.set_size_request(220, -1)
         self.sort_dropdown.connect("notify::selected", self._on_sort_changed)
@@ -449,17 +609,32 @@ class MainWindow(Adw.ApplicationWindow):
         self.progress_label.set_visible(False)
         main_box.append(self.progress_label)
 
-        # Module list
+        # Module list: the store holds every module, the filter and sort
+        # models narrow and order it, and the list view only creates rows
+        # for what is on screen
+        self._store = Gio.ListStore(item_type=StatsItem)
+        self._filter = Gtk.CustomFilter.new(self._filter_func)
+        self._filter_model = Gtk.FilterListModel(model=self._store, filter=self._filter)
+        # Filter in idle-time batches so typing stays responsive on big releases
+        self._filter_model.set_incremental(True)
+        self._filter_model.connect("notify::pending", self._on_filter_pending)
+        self._sorter = Gtk.CustomSorter.new(self._sort_func)
+        self._sort_model = Gtk.SortListModel(model=self._filter_model, sorter=self._sorter)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+
         scroll = Gtk.ScrolledWindow()
         scroll.set_vexpand(True)
-        self.listbox = Gtk.ListBox()
-        self.listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.listbox.add_css_class("boxed-list")
-        self.listbox.set_margin_top(8)
-        self.listbox.set_margin_bottom(8)
-        self.listbox.set_margin_start(12)
-        self.listbox.set_margin_end(12)
-        scroll.set_child(self.listbox)
+        self.listview = Gtk.ListView(model=Gtk.NoSelection(model=self._sort_model), factory=factory)
+        self.listview.set_show_separators(True)
+        self.listview.add_css_class("card")
+        self.listview.set_margin_top(8)
+        self.listview.set_margin_bottom(8)
+        self.listview.set_margin_start(12)
+        self.listview.set_margin_end(12)
+        scroll.set_child(self.listview)
         main_box.append(scroll)
 
         # Status bar
@@ -471,42 +646,44 @@ class MainWindow(Adw.ApplicationWindow):
         self.status_label = Gtk.Label(label=_("Loading..."))
         self.status_label.set_halign(Gtk.Align.START)
         self.status_label.set_hexpand(True)
-        self.status_label.add_css_class("dim-label")
-        self.status_label.add_css_class("caption")
+        _add_classes(self.status_label, "dim-label", "caption")
         status_box.append(self.status_label)
         main_box.append(Gtk.Separator())
         main_box.append(status_box)
 
-        self._filter_mode = "all"
-
         # Actions
         export_action = Gio.SimpleAction.new("export", None)
         export_action.connect("activate", self._on_export)
         self.add_action(export_action)
+        self.connect("close-request", self._on_close_request)
 
         # Load releases, then stats
         self._load_releases()
 
-    def _sort_stats(self, stats):
-        """Sort stats list based on current sort key."""
-        key = self._sort_key
-        if key == "pct_asc":
-            return sorted(stats, key=lambda s: s.pct)
-        elif key == "pct_desc":
-            return sorted(stats, key=lambda s: s.pct, reverse=True)
-        elif key == "name_asc":
-            return sorted(stats, key=lambda s: s.module.lower())
-        elif key == "name_desc":
-            return sorted(stats, key=lambda s: s.module.lower(), reverse=True)
-        elif key == "untrans_desc":
-            return sorted(stats, key=lambda s: s.untranslated, reverse=True)
-        elif key == "fuzzy_desc":
-            return sorted(stats, key=lambda s: s.fuzzy, reverse=True)
-        elif key == "total_desc":
-            return sorted(stats, key=lambda s: s.total, reverse=True)
-        elif key == "state":
-            return sorted(stats, key=lambda s: (s.state or "zzz").lower())
-        return stats
+    def _sort_func(self, a, b, *_args):
+        key, reverse = _SORT_KEYS[self._sort_key]
+        ka, kb = key(a.stats), key(b.stats)
+        order = (ka > kb) - (ka < kb)
+        return -order if reverse else order
+
+    def _filter_func(self, item, *_args):
+        return self._predicate is None or self._predicate(item.stats)
+
+    @staticmethod
+    def _build_predicate(mode, query):
+        """Return one function testing both filter mode and query, or None to show all."""
+        mode_test = _FILTER_MODES.get(mode)
+        if not query:
+            return mode_test
+        if mode_test is None:
+            return lambda s: query in s.module_lower
+        return lambda s: mode_test(s) and query in s.module_lower
+
+    def _on_row_setup(self, _factory, list_item):
+        list_item.set_child(StatsRow())
+
+    def _on_row_bind(self, _factory, list_item):
+        list_item.get_child().bind(list_item.get_item().stats)
 
     def _load_releases(self):
         def do_load():
@@ -518,93 +695,130 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception as e:
                 GLib.idle_add(self.status_label.set_text, f"Error: {e}")
 
-        threading.Thread(target=do_load, daemon=True).start()
+        self._executor.submit(do_load)
 
     def _on_releases_loaded(self, releases):
-        self._releases = releases
         names = [f"{r['name']} ({r['description']})" for r in releases]
         model = Gtk.StringList.new(names)
         self.release_dropdown.set_model(model)
 
         # Select configured release
-        for i, r in enumerate(releases):
-            if r["name"] == self._release:
-                self.release_dropdown.set_selected(i)
-                break
-
+        self._release_index = {r["name"]: i for i, r in enumerate(releases)}
+        idx = self._release_index.get(self._release)
+        if idx is not None:
+            self.release_dropdown.set_selected(idx)
+        elif releases:
+            self._release = releases[0]["name"]
+
+        # Set last so the selection changes above do not each start a load
+        self._releases = releases
         self._load_stats()
 
-    def _load_stats(self):
+    def _load_stats(self, force=False):
+        # Dropdown signals can repeat the current selection; only refresh reloads it
+        key = (self._release, self._language)
+        if key == self._stats_key and not force:
+            return
+        self._stats_key = key
+
+        # Results from any earlier load are stale once this one starts
+        self._fetch_gen += 1
+        gen = self._fetch_gen
+        release, language = self._release, self._language
+
+        # Try cache first; only show the spinner when we have to fetch
+        cached = load_cache(release, language)
+        if cached:
+            self._on_stats_loaded(cached, gen)
+            return
+
         self.spinner.set_visible(True)
         self.spinner.start()
         self.progress_label.set_visible(True)
         self.progress_label.set_text(_("Loading module statistics..."))
 
-        # Try cache first
-        cached = load_cache(self._release, self._language)
-        if cached:
-            self._on_stats_loaded(cached)
-            return
-
         def do_load():
             def progress(current, total):
-                GLib.idle_add(self.progress_label.set_text,
-                             _("Loading %d / %d modules...") % (current, total))
+                if gen == self._fetch_gen:
+                    GLib.idle_add(self.progress_label.set_text,
+                                 _("Loading %d / %d modules...") % (current, total))
 
             try:
-                stats = fetch_all_stats(self._release, self._language, progress_cb=progress)
-                save_cache(self._release, self._language, stats)
-                GLib.idle_add(self._on_stats_loaded, stats)
+                stats = fetch_all_stats(release, language, progress_cb=progress,
+                                        cancelled=lambda: gen != self._fetch_gen)
+                # A newer load owns the cache now; don't overwrite it with this one
+                if stats is None or gen != self._fetch_gen:
+                    return
+                save_cache(release, language, stats)
+                GLib.idle_add(self._on_stats_loaded, stats, gen)
             except Exception as e:
-                GLib.idle_add(self.status_label.set_text, f"Error: {e}")
-                GLib.idle_add(self.spinner.stop)
+                GLib.idle_add(self._on_stats_failed, e, gen)
 
-        threading.Thread(target=do_load, daemon=True).start()
+        # A reload supersedes one that is still queued behind the worker
+        if self._stats_future is not None:
+            self._stats_future.cancel()
+        self._stats_future = self._executor.submit(do_load)
 
-    def _on_stats_loaded(self, stats):
+    def _on_stats_loaded(self, stats, gen):
+        if gen != self._fetch_gen:
+            return
         self._stats = stats
         self.spinner.stop()
         self.spinner.set_visible(False)
         self.progress_label.set_visible(False)
-        self._update_view()
+        self._loaded_at = time.strftime("%H:%M:%S")
+        self._store.splice(0, self._store.get_n_items(), [StatsItem(s) for s in stats])
+        self._update_summary()
+        self._update_status()
 
-    def _update_view(self):
-        # Clear listbox
-        while True:
-            row = self.listbox.get_first_child()
-            if row is None:
-                break
-            self.listbox.remove(row)
+    def _on_stats_failed(self, error, gen):
+        if gen != self._fetch_gen:
+            return
+        self._stats_key = None
+        self.status_label.set_text(f"Error: {error}")
+        self.spinner.stop()
 
+    def _update_view(self):
         query = self.search_entry.get_text().lower().strip() if self.search_btn.get_active() else ""
-
-        filtered = list(self._stats)
-        if self._filter_mode == "incomplete":
-            filtered = [s for s in filtered if not s.complete]
-        elif self._filter_mode == "complete":
-            filtered = [s for s in filtered if s.complete]
-        elif self._filter_mode == "fuzzy":
-            filtered = [s for s in filtered if s.fuzzy > 0]
-        elif self._filter_mode == "state_translated":
-            filtered = [s for s in filtered if s.state and s.state.lower() == "translated"]
-
-        if query:
-            filtered = [s for s in filtered if query in s.module.lower()]
-
-        # Sort
-        filtered = self._sort_stats(filtered)
-
-        for s in filtered:
-            row = StatsRow(s)
-            self.listbox.append(row)
-
-        # Summary
-        total_trans = sum(s.translated for s in self._stats)
-        total_fuzzy = sum(s.fuzzy for s in self._stats)
-        total_untrans = sum(s.untranslated for s in self._stats)
+        change = self._filter_change(self._applied_mode, self._query, self._filter_mode, query)
+        self._applied_mode = self._filter_mode
+        self._query = query
+        self._predicate = self._build_predicate(self._filter_mode, query)
+        if change is not None:
+            self._filter.changed(change)
+        self._update_status()
+
+    @staticmethod
+    def _filter_change(old_mode, old_query, mode, query):
+        """Classify a filter change so GTK only re-checks items that can flip.
+
+        Returns None when nothing changed.
+        """
+        stricter = old_query in query and (mode == old_mode or old_mode == "all")
+        looser = query in old_query and (mode == old_mode or mode == "all")
+        if stricter and looser:
+            return None
+        if stricter:
+            return Gtk.FilterChange.MORE_STRICT
+        if looser:
+            return Gtk.FilterChange.LESS_STRICT
+        return Gtk.FilterChange.DIFFERENT
+
+    def _on_filter_pending(self, model, _pspec):
+        # The shown count is only final once incremental filtering is done
+        if model.get_pending() == 0:
+            self._update_status()
+
+    def _update_summary(self):
+        """Show totals over all loaded modules; they do not depend on filters."""
+        total_trans = total_fuzzy = total_untrans = complete = 0
+        for s in self._stats:
+            total_trans += s.translated
+            total_fuzzy += s.fuzzy
+            total_untrans += s.untranslated
+            complete += s.complete
         total_all = total_trans + total_fuzzy + total_untrans
         pct = (total_trans / total_all * 100) if total_all > 0 else 0
-        complete = sum(1 for s in self._stats if s.complete)
 
         self.summary_label.set_text(
             _("%d modules — %d complete — %d fuzzy — %d untranslated") % (
@@ -613,17 +827,17 @@ class MainWindow(Adw.ApplicationWindow):
         self.summary_progress.set_fraction(pct / 100)
         self.summary_progress.set_text(f"{pct:.1f}% ({total_trans}/{total_all})")
 
-        now = datetime.now().strftime("%H:%M:%S")
+    def _update_status(self):
         self.status_label.set_text(
-            f"[{now}] {self._release} / {self._language} — "
-            + _("%d modules shown, %d total") % (len(filtered), len(self._stats))
+            f"[{self._loaded_at}] {self._release} / {self._language} — "
+            + _("%d modules shown, %d total") % (self._sort_model.get_n_items(), len(self._stats))
         )
 
     def _on_sort_changed(self, dropdown, _pspec):
         idx = dropdown.get_selected()
         if idx < len(SORT_OPTIONS):
             self._sort_key = SORT_OPTIONS[idx][0]
-            self._update_view()
+            self._sorter.changed(Gtk.SorterChange.DIFFERENT)
 
     def _on_release_changed(self, dropdown, _pspec):
         idx = dropdown.get_selected()
@@ -662,37 +876,47 @@ class MainWindow(Adw.ApplicationWindow):
         self._update_view()
 
     def _on_refresh(self, *_args):
-        cache_file = get_cache_dir() / "stats_cache.json"
-        if cache_file.exists():
-            cache_file.unlink()
-        self._load_stats()
+        clear_cache()
+        self._load_stats(force=True)
 
     def _on_export(self, *_args):
-        import csv, io
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["Module", "Branch", "Domain", "State", "Translated", "Fuzzy",
-                         "Untranslated", "Total", "Percent", "Vertimus URL"])
-        for s in self._sort_stats(self._stats):
-            writer.writerow([s.module, s.branch, s.domain, s.state, s.translated,
-                             s.fuzzy, s.untranslated, s.total, f"{s.pct:.1f}",
-                             s.vertimus_url])
-        writer.writerow([])
-        writer.writerow([f"GNOME L10n v{__version__} — Daniel Nylander"])
-
         dialog = Gtk.FileDialog.new()
         dialog.set_initial_name(f"gnome-l10n-{self._release}-{self._language}.csv")
-        dialog.save(self, None, self._on_export_save, output.getvalue())
+        dialog.save(self, None, self._on_export_save, (self._stats, self._sort_key))
 
-    def _on_export_save(self, dialog, result, csv_data):
+    def _on_export_save(self, dialog, result, snapshot):
         try:
             gfile = dialog.save_finish(result)
-            path = gfile.get_path()
-            with open(path, "w") as f:
-                f.write(csv_data)
-            self.status_label.set_text(_("Exported to %s") % path)
         except Exception:
-            pass
+            return
+        stats, sort_key = snapshot
+
+        # Sort and format off the main loop, then write with async GIO
+        def do_build():
+            key, reverse = _SORT_KEYS[sort_key]
+            data = _stats_csv(sorted(stats, key=key, reverse=reverse)).encode("utf-8")
+            GLib.idle_add(self._write_export, gfile, data)
+
+        self._executor.submit(do_build)
+
+    def _write_export(self, gfile, data):
+        gfile.replace_contents_bytes_async(
+            GLib.Bytes.new(data), None, False, Gio.FileCreateFlags.NONE, None,
+            self._on_export_written)
+
+    def _on_export_written(self, gfile, result):
+        try:
+            gfile.replace_contents_finish(result)
+            self.status_label.set_text(_("Exported to %s") % gfile.get_path())
+        except Exception as e:
+            self.status_label.set_text(f"Error: {e}")
+
+    def _on_close_request(self, *_args):
+        # End a running load through its cancelled callback and drop queued ones,
+        # so closing does not wait for them
+        self._fetch_gen += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return False
 
     def _toggle_theme(self, btn):
         mgr = Adw.StyleManager.get_default()
@@ -782,8 +1006,12 @@ class Application(Adw.Application):
 
 
 def main():
+    prewarm()
     app = Application()
-    return app.run(sys.argv)
+    try:
+        return app.run(sys.argv)
+    finally:
+        shutdown()
 
 
 if __name__ == "__main__":